@@ -1,5 +1,6 @@
 import numpy as np
 from scipy import optimize
+from numba import njit
 
 from ...utils.date import Date
 from ...utils.error import FinError
@@ -18,29 +19,75 @@ from ...products.bonds.bond import YTMCalcType
 
 ###############################################################################
 
-def _f(y, *args):
-    """ Function used to do root search in price to yield calculation. """
-    bond = args[0]
-    settlement_date = args[1]
-    price = args[2]
-    convention = args[3]
-    px = bond.full_price_from_ytm(settlement_date, y, convention)
-    obj_fn = px - price
-    return obj_fn
 
+@njit(fastmath=True, cache=True)
+def _price_simple(y, par, acc_factor):
+    """ Full price of a zero coupon bond from its yield using simple
+    interest. Vectorised in y and acc_factor. """
+
+    return par / (1.0 + y * acc_factor)
+
+###############################################################################
+
+
+@njit(fastmath=True, cache=True)
+def _price_compound(y, par, acc_factor):
+    """ Full price of a zero coupon bond from its yield using annual
+    compounding. Vectorised in y and acc_factor. """
+
+    return par / (1.0 + y) ** acc_factor
+
+###############################################################################
+
+
+def _zero_full_price(y, par, acc_factor):
+    """ Full price of a zero coupon bond from its yield. Simple interest is
+    used up to one year and annual compounding beyond. The choice depends
+    only on the bond and settlement date so it is made here once and the
+    compiled kernels are branch free. Vectorised in y. """
+
+    if acc_factor <= 1.0:
+        return _price_simple(y, par, acc_factor)
+    else:
+        return _price_compound(y, par, acc_factor)
 
 ###############################################################################
 
 
-def _g(oas, *args):
-    """ Function used to do root search in price to OAS calculation. """
-    bond = args[0]
-    settlement_date = args[1]
-    price = args[2]
-    discount_curve = args[3]
-    px = bond.full_price_from_oas(settlement_date, discount_curve, oas)
-    obj_fn = px - price
-    return obj_fn
+@njit(fastmath=True, cache=True)
+def _zero_dollar_duration(y, par, acc_factor):
+    """ Analytic first derivative -dP/dy of _zero_full_price. """
+
+    if acc_factor <= 1.0:
+        return acc_factor * par / (1.0 + y * acc_factor) ** 2
+    else:
+        return acc_factor * par / (1.0 + y) ** (acc_factor + 1.0)
+
+###############################################################################
+
+
+@njit(fastmath=True, cache=True)
+def _zero_convexity(y, par, acc_factor):
+    """ Analytic second derivative d2P/dy2 of _zero_full_price. """
+
+    if acc_factor <= 1.0:
+        return 2.0 * acc_factor ** 2 * par / (1.0 + y * acc_factor) ** 3
+    else:
+        return acc_factor * (acc_factor + 1.0) * par \
+            / (1.0 + y) ** (acc_factor + 2.0)
+
+###############################################################################
+
+
+@njit(fastmath=True, cache=True)
+def _zero_ytm(full_prices, par, acc_factor):
+    """ Yield of a zero coupon bond from its full price. This is the exact
+    inverse of _zero_full_price. Vectorised in the full price. """
+
+    if acc_factor <= 1.0:
+        return (par / full_prices - 1.0) / acc_factor
+    else:
+        return (par / full_prices) ** (1.0 / acc_factor) - 1.0
 
 ###############################################################################
 
@@ -81,10 +128,22 @@ class BondZero:
         self._coupon_dates = [issue_date, maturity_date]
         self._payment_dates = [issue_date, maturity_date]
         self._flow_amounts = [0.0, 0.0]  # coupon payments are zero
+        self._future_dates = self._coupon_dates[1:]
+        self._coupon_ordinals = np.array([dt._excel_date
+                                          for dt in self._coupon_dates])
+        self._flow_amount_arr = np.array(self._flow_amounts)
+
+        self._dc = DayCount(self._accrual_type)
+        (self._tenor_acc_factor, _, _) = self._dc.year_frac(issue_date,
+                                                            maturity_date,
+                                                            maturity_date,
+                                                            FrequencyTypes.ZERO)
+        self._acc_factor_cache = (None, None)
 
         self._accrued_interest = None
         self._accrued_days = 0.0
         self._alpha = 0.0
+        self._ai_cache = (None, None)
 
     ###########################################################################
 
@@ -101,35 +160,41 @@ class BondZero:
 
         self.calc_accrued_interest(settlement_date)
 
-        ytm = np.array(ytm)  # VECTORIZED
-        ytm = ytm + 0.000000000012345  # SNEAKY LOW-COST TRICK TO AVOID y=0
-
-        # n is the number of flows after the next coupon
-        n = 0
-        for dt in self._coupon_dates:
-            if dt > settlement_date:
-                n += 1
-        n = n - 1
+        # Scalar yields are priced as they are and only others become arrays.
+        # The zero bond formulas are well defined at y=0 so need no offset.
+        if not np.isscalar(ytm):
+            ytm = np.asarray(ytm, dtype=float)  # VECTORIZED
 
-        if n < 0:
-            raise FinError("No coupons left")
         # A zero coupon bond has a price equal to the discounted principal
         # assuming an annualised rate raised to the power of years
 
-        dc = DayCount(self._accrual_type)
-        (acc_factor, num, _) = dc.year_frac(settlement_date,
-                                            self._maturity_date,
-                                            self._maturity_date,
-                                            FrequencyTypes.ZERO)
-        if acc_factor <= 1:
-            pv = self._par / (1.0 + ytm * acc_factor)
-        else:
-            pv = self._par / (1.0 + ytm) ** acc_factor
-
+        acc_factor = self._acc_factor(settlement_date)
+        pv = _zero_full_price(ytm, self._par, acc_factor)
         return pv
 
     ###########################################################################
 
+    def _acc_factor(self,
+                    settlement_date: Date):
+        """ Year fraction from the settlement date to maturity. This is
+        reused until the settlement date changes. """
+
+        if self._acc_factor_cache[0] == settlement_date._excel_date:
+            return self._acc_factor_cache[1]
+
+        if settlement_date >= self._maturity_date:
+            raise FinError("No coupons left")
+
+        (acc_factor, _, _) = self._dc.year_frac(settlement_date,
+                                                self._maturity_date,
+                                                self._maturity_date,
+                                                FrequencyTypes.ZERO)
+
+        self._acc_factor_cache = (settlement_date._excel_date, acc_factor)
+        return acc_factor
+
+    ###########################################################################
+
     def principal(self,
                   settlement_date: Date,
                   y: float,
@@ -150,13 +215,14 @@ class BondZero:
                         settlement_date: Date,
                         ytm: float,
                         convention: YTMCalcType = YTMCalcType.ZERO):
-        """ Calculate the risk or dP/dy of the bond by bumping. This is also
+        """ Calculate the risk or dP/dy of the bond analytically. This is also
         known as the DV01 in Bloomberg. """
 
-        dy = 0.0001  # 1 basis point
-        p0 = self.full_price_from_ytm(settlement_date, ytm - dy, convention)
-        p2 = self.full_price_from_ytm(settlement_date, ytm + dy, convention)
-        durn = -(p2 - p0) / dy / 2.0
+        if convention != YTMCalcType.ZERO:
+            raise FinError("Need to use YTMCalcType.ZERO for zero coupon bond")
+
+        acc_factor = self._acc_factor(settlement_date)
+        durn = _zero_dollar_duration(ytm, self._par, acc_factor)
         return durn
 
     ###########################################################################
@@ -168,8 +234,12 @@ class BondZero:
         """ Calculate the Macauley duration of the bond on a settlement date
         given its yield to maturity. """
 
-        dd = self.dollar_duration(settlement_date, ytm, convention)
-        fp = self.full_price_from_ytm(settlement_date, ytm, convention)
+        if convention != YTMCalcType.ZERO:
+            raise FinError("Need to use YTMCalcType.ZERO for zero coupon bond")
+
+        acc_factor = self._acc_factor(settlement_date)
+        dd = _zero_dollar_duration(ytm, self._par, acc_factor)
+        fp = _zero_full_price(ytm, self._par, acc_factor)
         md = dd * (1.0 + ytm) / fp
         return md
 
@@ -182,8 +252,12 @@ class BondZero:
         """ Calculate the modified duration of the bondon a settlement date
         given its yield to maturity. """
 
-        dd = self.dollar_duration(settlement_date, ytm, convention)
-        fp = self.full_price_from_ytm(settlement_date, ytm, convention)
+        if convention != YTMCalcType.ZERO:
+            raise FinError("Need to use YTMCalcType.ZERO for zero coupon bond")
+
+        acc_factor = self._acc_factor(settlement_date)
+        dd = _zero_dollar_duration(ytm, self._par, acc_factor)
+        fp = _zero_full_price(ytm, self._par, acc_factor)
         md = dd / fp
         return md
 
@@ -196,11 +270,13 @@ class BondZero:
         """ Calculate the bond convexity from the yield to maturity. This
         function is vectorised with respect to the yield input. """
 
-        dy = 0.0001
-        p0 = self.full_price_from_ytm(settlement_date, ytm - dy, convention)
-        p1 = self.full_price_from_ytm(settlement_date, ytm, convention)
-        p2 = self.full_price_from_ytm(settlement_date, ytm + dy, convention)
-        conv = ((p2 + p0) - 2.0 * p1) / dy / dy / p1 / self._par
+        if convention != YTMCalcType.ZERO:
+            raise FinError("Need to use YTMCalcType.ZERO for zero coupon bond")
+
+        acc_factor = self._acc_factor(settlement_date)
+        d2p = _zero_convexity(ytm, self._par, acc_factor)
+        fp = _zero_full_price(ytm, self._par, acc_factor)
+        conv = d2p / fp / self._par
         return conv
 
     ###########################################################################
@@ -250,21 +326,10 @@ class BondZero:
         if settlement_date > self._maturity_date:
             raise FinError("Bond settles after it matures.")
 
-        px = 0.0
-        df = 1.0
-        dfSettle = discount_curve.df(settlement_date, )
-
-        for dt in self._coupon_dates[1:]:
-
-            # coupons paid on the settlement date are included
-            if dt >= settlement_date:
-                df = discount_curve.df(dt)
-                flow = 0
-                pv = flow * df
-                px += pv
-
-        px += df * self._redemption
-        px = px / dfSettle
+        # The only cash flow is the principal paid at maturity
+        df = discount_curve.df(self._maturity_date)
+        dfSettle = discount_curve.df(settlement_date)
+        px = df * self._redemption / dfSettle
 
         return px * self._par
 
@@ -276,12 +341,7 @@ class BondZero:
         coupon divided by the clean price (not the full price). The coupon of a zero coupon bond is defined as:
         (par - issue_price) / tenor
         """
-        dc = DayCount(self._accrual_type)
-        tenor, _, _ = dc.year_frac(self._issue_date,
-                                   self._maturity_date,
-                                   self._maturity_date,
-                                   FrequencyTypes.ZERO)
-        virtual_coupon = (self._par - self._issue_price) / tenor
+        virtual_coupon = (self._par - self._issue_price) / self._tenor_acc_factor
         y = virtual_coupon / clean_price
         return y
 
@@ -291,39 +351,40 @@ class BondZero:
                           settlement_date: Date,
                           clean_price: float,
                           convention: YTMCalcType = YTMCalcType.ZERO):
-        """ Calculate the bond's yield to maturity by solving the price
-        yield relationship using a one-dimensional root solver. """
-
-        if type(clean_price) is float or type(clean_price) is np.float64:
-            clean_prices = np.array([clean_price])
-        elif type(clean_price) is list or type(clean_price) is np.ndarray:
-            clean_prices = np.array(clean_price)
+        """ Calculate the bond's yield to maturity by inverting the price
+        yield relationship. For a zero coupon bond this has a closed form. """
+
+        # All prices are inverted together in a single array expression
+        if isinstance(clean_price, (float, int, np.number)):
+            clean_prices = np.array([clean_price], dtype=float)
+        elif isinstance(clean_price, (list, np.ndarray)):
+            clean_prices = np.asarray(clean_price, dtype=float)
         else:
             raise FinError("Unknown type for clean_price "
                            + str(type(clean_price)))
 
+        if convention != YTMCalcType.ZERO:
+            raise FinError("Need to use YTMCalcType.ZERO for zero coupon bond")
+
+        if settlement_date >= self._maturity_date:
+            raise FinError("No coupons left")
+
         self.calc_accrued_interest(settlement_date)
         accrued_amount = self._accrued_interest * self._par / self._face_amount
         full_prices = (clean_prices + accrued_amount)
-        ytms = []
-
-        for full_price in full_prices:
-            argtuple = (self, settlement_date, full_price, convention)
 
-            ytm = optimize.newton(_f,
-                                  x0=0.05,  # guess initial value of 5%
-                                  fprime=None,
-                                  args=argtuple,
-                                  tol=1e-8,
-                                  maxiter=50,
-                                  fprime2=None)
+        if np.any(full_prices <= 0.0):
+            raise FinError("Full price must be positive to have a yield")
 
-            ytms.append(ytm)
+        # The price of a zero coupon bond is a single discounted principal so
+        # the price yield relationship can be inverted analytically
+        acc_factor = self._acc_factor(settlement_date)
+        ytms = _zero_ytm(full_prices, self._par, acc_factor)
 
         if len(ytms) == 1:
             return ytms[0]
         else:
-            return np.array(ytms)
+            return ytms
 
     ###########################################################################
 
@@ -340,27 +401,38 @@ class BondZero:
         calendar to be used - NONE means only calendar days, WEEKEND is only
         weekends or you can specify a country calendar for business days."""
 
+        # The result only depends on the inputs so reuse the last calculation
+        key = (settlement_date._excel_date, num_ex_dividend_days, calendar_type)
+
+        if self._ai_cache[0] == key:
+            (self._accrued_interest, self._accrued_days, self._alpha,
+             self._pcd, self._ncd) = self._ai_cache[1]
+            return self._accrued_interest
+
         num_flows = len(self._coupon_dates)
 
         if num_flows == 0:
             raise FinError("Accrued interest - not enough flow dates.")
 
-        for iFlow in range(1, num_flows):
-            # coupons paid on a settlement date are paid
-            if self._coupon_dates[iFlow] >= settlement_date:
-                self._pcd = self._coupon_dates[iFlow - 1]
-                self._ncd = self._coupon_dates[iFlow]
-                break
+        # coupons paid on a settlement date are paid
+        iFlow = np.searchsorted(self._coupon_ordinals,
+                                settlement_date._excel_date, side='left')
+        iFlow = max(iFlow, 1)
+
+        if iFlow == num_flows:
+            raise FinError("Bond settles after it matures.")
+
+        self._pcd = self._coupon_dates[iFlow - 1]
+        self._ncd = self._coupon_dates[iFlow]
 
-        dc = DayCount(self._accrual_type)
         cal = Calendar(calendar_type)
         exDividend_date = cal.add_business_days(
             self._ncd, -num_ex_dividend_days)
 
-        (acc_factor, num, _) = dc.year_frac(self._pcd,
-                                            settlement_date,
-                                            self._ncd,
-                                            FrequencyTypes.ZERO)
+        (acc_factor, num, _) = self._dc.year_frac(self._pcd,
+                                                  settlement_date,
+                                                  self._ncd,
+                                                  FrequencyTypes.ZERO)
 
         if settlement_date > exDividend_date:
             acc_factor = acc_factor - 1.0
@@ -371,6 +443,9 @@ class BondZero:
         self._accrued_interest = interest * self._face_amount / self._par
         self._accrued_days = num
 
+        self._ai_cache = (key, (self._accrued_interest, self._accrued_days,
+                                self._alpha, self._pcd, self._ncd))
+
         return self._accrued_interest
 
     ###########################################################################
@@ -389,26 +464,20 @@ class BondZero:
         is a Ibor curve that is passed in. This function is vectorised with
         respect to the clean price. """
 
+        if settlement_date > self._maturity_date:
+            raise FinError("Bond settles after it matures.")
+
         clean_price = np.array(clean_price)
         self.calc_accrued_interest(settlement_date)
         accrued_amount = self._accrued_interest * self._par / self._face_amount
         bondPrice = clean_price + accrued_amount
         # Calculate the price of the bond discounted on the Ibor curve
-        pvIbor = 0.0
-        prev_date = self._pcd
-
-        for dt in self._coupon_dates[1:]:
-
-            # coupons paid on a settlement date are included
-            if dt >= settlement_date:
-                df = discount_curve.df(dt)
-                # pvIbor += df * self._coupon / self._frequency
-
-        pvIbor += df * self._redemption
+        # The only cash flow is the principal paid at maturity
+        df_mat = discount_curve.df(self._maturity_date)
+        pvIbor = df_mat * self._redemption
 
         # Calculate the PV01 of the floating leg of the asset swap
         # I assume here that the coupon starts accruing on the settlement date
-        prev_date = self._pcd
         schedule = Schedule(settlement_date,
                             self._maturity_date,
                             swapFloatFrequencyType,
@@ -418,13 +487,12 @@ class BondZero:
 
         day_count = DayCount(swapFloatDayCountConventionType)
 
-        prev_date = self._pcd
-        pv01 = 0.0
-        for dt in schedule._adjusted_dates[1:]:
-            df = discount_curve.df(dt)
-            year_frac = day_count.year_frac(prev_date, dt)[0]
-            pv01 = pv01 + year_frac * df
-            prev_date = dt
+        pay_dates = schedule._adjusted_dates[1:]
+        start_dates = [self._pcd] + pay_dates[:-1]
+        year_fracs = np.array([day_count.year_frac(d1, d2)[0]
+                               for d1, d2 in zip(start_dates, pay_dates)])
+        dfs = discount_curve.df(pay_dates)
+        pv01 = np.sum(year_fracs * dfs)
 
         asw = (pvIbor - bondPrice / self._par) / pv01
         return asw
@@ -438,24 +506,22 @@ class BondZero:
         """ Calculate the full price of the bond from its OAS given the bond
         settlement date, a discount curve and the oas as a number. """
 
-        self.calc_accrued_interest(settlement_date)
-
-        pv = 0.0
-        for dt in self._coupon_dates[1:]:
+        if settlement_date > self._maturity_date:
+            raise FinError("Bond settles after it matures.")
 
-            # coupons paid on a settlement date are included
-            if dt >= settlement_date:
-                t = (dt - settlement_date) / gDaysInYear
+        self.calc_accrued_interest(settlement_date)
 
-                t = np.maximum(t, gSmall)
+        # The only cash flow is the principal paid at maturity
+        t = (self._maturity_date - settlement_date) / gDaysInYear
+        t = np.maximum(t, gSmall)
 
-                df = discount_curve.df(dt)
-                # determine the Ibor implied zero rate
-                r = np.power(df, -1.0 / t) - 1.0
-                # determine the OAS adjusted zero rate
-                df_adjusted = np.power(1.0 + (r + oas), -t)
+        df = discount_curve.df(self._maturity_date)
+        # determine the Ibor implied zero rate
+        r = np.power(df, -1.0 / t) - 1.0
+        # determine the OAS adjusted zero rate
+        df_adjusted = np.power(1.0 + (r + oas), -t)
 
-        pv = pv + df_adjusted * self._redemption
+        pv = df_adjusted * self._redemption
         pv *= self._par
         return pv
 
@@ -468,38 +534,43 @@ class BondZero:
         """ Return OAS for bullet bond given settlement date, clean bond price
         and the discount relative to which the spread is to be computed. """
 
-        if type(clean_price) is float or type(clean_price) is np.float64:
-            clean_prices = np.array([clean_price])
-        elif type(clean_price) is list or type(clean_price) is np.ndarray:
-            clean_prices = np.array(clean_price)
+        # All prices are inverted together in a single array expression
+        if isinstance(clean_price, (float, int, np.number)):
+            clean_prices = np.array([clean_price], dtype=float)
+        elif isinstance(clean_price, (list, np.ndarray)):
+            clean_prices = np.asarray(clean_price, dtype=float)
         else:
             raise FinError("Unknown type for clean_price "
                            + str(type(clean_price)))
 
+        if settlement_date >= self._maturity_date:
+            raise FinError("No coupons left")
+
         self.calc_accrued_interest(settlement_date)
 
         accrued_amount = self._accrued_interest * self._par / self._face_amount
         full_prices = clean_prices + accrued_amount
 
-        oass = []
-
-        for full_price in full_prices:
-            argtuple = (self, settlement_date, full_price, discount_curve)
+        # The price is strictly decreasing in the OAS so a positive price
+        # has exactly one root and the closed form below always finds it
+        if np.any(full_prices <= 0.0):
+            raise FinError("Full price must be positive to have an OAS")
 
-            oas = optimize.newton(_g,
-                                  x0=0.01,  # initial value of 1%
-                                  fprime=None,
-                                  args=argtuple,
-                                  tol=1e-8,
-                                  maxiter=50,
-                                  fprime2=None)
+        # Only the principal survives so the OAS equation inverts exactly
+        t = (self._maturity_date - settlement_date) / gDaysInYear
+        t = np.maximum(t, gSmall)
 
-            oass.append(oas)
+        df = discount_curve.df(self._maturity_date)
+        # determine the Ibor implied zero rate
+        r = np.power(df, -1.0 / t) - 1.0
+        # solve par * redemption * (1 + r + oas)^(-t) = full price for oas
+        oass = np.power(self._par * self._redemption / full_prices,
+                        1.0 / t) - 1.0 - r
 
         if len(oass) == 1:
             return oass[0]
         else:
-            return np.array(oass)
+            return oass
 
     ###########################################################################
 
@@ -537,36 +608,28 @@ class BondZero:
         more accuracy. I reduce any error by averaging period start and period
         end payment present values. """
 
-        pv = 0.0
-        prevQ = 1.0
-        prevDf = 1.0
-
-        defaultingPrincipalPVPayStart = 0.0
-        defaultingPrincipalPVPayEnd = 0.0
-
-        for dt in self._coupon_dates[1:]:
-
-            # coupons paid on a settlement date are included
-            if dt >= settlement_date:
-                df = discount_curve.df(dt)
-                q = survival_curve.survival_prob(dt)
+        if settlement_date > self._maturity_date:
+            raise FinError("Bond settles after it matures.")
 
-                # Add PV of coupon conditional on surviving to payment date
-                # Any default results in all subsequent coupons being lost
-                # with zero recovery
+        # coupons paid on a settlement date are included
+        dates = [dt for dt in self._future_dates if dt >= settlement_date]
 
-                dq = q - prevQ
+        dfs = discount_curve.df(dates)
+        # survival curves differ in the vector inputs they accept so they are
+        # given dates one at a time. A zero coupon bond only has one.
+        qs = np.array([survival_curve.survival_prob(dt) for dt in dates])
 
-                defaultingPrincipalPVPayStart += -dq * recovery_rate * prevDf
-                defaultingPrincipalPVPayStart += -dq * recovery_rate * df
+        prevDfs = np.concatenate(([1.0], dfs[:-1]))
+        dqs = np.diff(np.concatenate(([1.0], qs)))
 
-                # Add on PV of principal if default occurs in coupon period
-                prevQ = q
-                prevDf = df
+        # Add on PV of principal if default occurs in coupon period
+        defaultingPrincipalPVPayStart = np.sum(-dqs * recovery_rate * prevDfs)
+        defaultingPrincipalPVPayEnd = np.sum(-dqs * recovery_rate * dfs)
 
+        pv = 0.0
         pv = pv + 0.50 * defaultingPrincipalPVPayStart
         pv = pv + 0.50 * defaultingPrincipalPVPayEnd
-        pv = pv + df * q * self._redemption
+        pv = pv + dfs[-1] * qs[-1] * self._redemption
         pv *= self._par
         return pv
 
@@ -606,14 +669,17 @@ class BondZero:
         """
         buy_price = self.full_price_from_ytm(begin_date, begin_ytm, convention)
         sell_price = self.full_price_from_ytm(end_date, end_ytm, convention)
-        dates_cfs = zip(self._coupon_dates, self._flow_amounts)
+        begin_ord = begin_date._excel_date
+        end_ord = end_date._excel_date
         # The coupon or par payments on buying date belong to the buyer.
         # The coupon or par payments on selling date are given to the new buyer.
-        dates_cfs = [(d, c * self._par) for (d, c) in dates_cfs if (d >= begin_date) and (d < end_date)]
-        dates_cfs.append((begin_date, -buy_price))
-        dates_cfs.append((end_date, sell_price))
-        times_cfs = [((d - begin_date)/365, c) for (d, c) in dates_cfs]
-        pnl = sum(c for (t, c) in times_cfs)
+        mask = (self._coupon_ordinals >= begin_ord) & (self._coupon_ordinals < end_ord)
+        times = np.concatenate([(self._coupon_ordinals[mask] - begin_ord) / 365,
+                                [0.0, (end_ord - begin_ord) / 365]])
+        cfs = np.concatenate([self._flow_amount_arr[mask] * self._par,
+                              [-buy_price, sell_price]])
+        times_cfs = list(zip(times, cfs))
+        pnl = cfs.sum()
         simple_return = (pnl / buy_price) * 365 / (end_date - begin_date)
         brentq_up_bound = 5
         brentq_down_bound = -0.9999
@@ -630,6 +696,68 @@ class BondZero:
 
         return simple_return, irr, pnl
 
+    ###########################################################################
+
+    @staticmethod
+    def batch_full_price_from_ytm(maturity_dates: list,
+                                  settlement_date: Date,
+                                  ytms: (float, np.ndarray),
+                                  par: float = 100.0):
+        """ Calculate the full prices of a portfolio of zero coupon bonds with
+        the given maturity dates from their yields to maturity in a single
+        array calculation. The yields can be one number or one per bond. """
+
+        if len(maturity_dates) == 0:
+            raise FinError("No maturity dates supplied.")
+
+        ytms = np.asarray(ytms, dtype=float)
+
+        if ytms.ndim > 1 or (ytms.ndim == 1 and
+                             len(ytms) != len(maturity_dates)):
+            raise FinError("Need one yield or one per maturity date.")
+
+        if settlement_date >= min(maturity_dates):
+            raise FinError("No coupons left")
+
+        dc = DayCount(DayCountTypes.ZERO)
+        acc_factors = np.array([dc.year_frac(settlement_date,
+                                             dt,
+                                             dt,
+                                             FrequencyTypes.ZERO)[0]
+                                for dt in maturity_dates])
+
+        simple = _price_simple(ytms, par, acc_factors)
+        compound = _price_compound(ytms, par, acc_factors)
+        pv = np.where(acc_factors <= 1.0, simple, compound)
+        return pv
+
+    ###########################################################################
+
+    @staticmethod
+    def batch_full_price_from_discount_curve(maturity_dates: list,
+                                             settlement_date: Date,
+                                             discount_curve: DiscountCurve,
+                                             par: float = 100.0):
+        """ Calculate the full prices of a portfolio of zero coupon bonds with
+        the given maturity dates using a single call to the discount curve to
+        PV the principals to the settlement date. """
+
+        if len(maturity_dates) == 0:
+            raise FinError("No maturity dates supplied.")
+
+        if settlement_date < discount_curve._valuation_date:
+            raise FinError("Bond settles before Discount curve date")
+
+        if settlement_date > min(maturity_dates):
+            raise FinError("Bond settles after it matures.")
+
+        dfs = discount_curve.df(list(maturity_dates))
+        dfSettle = discount_curve.df(settlement_date)
+        pv = dfs / dfSettle
+        return pv * par
+
+    ###########################################################################
+
     def __repr__(self):
 
         s = label_to_string("OBJECT TYPE", type(self).__name__)
@@ -5,13 +5,18 @@
 import sys
 sys.path.append("..")
 import pandas as pd
+import pytest
 
 from financepy.utils.frequency import FrequencyTypes
 from financepy.utils.day_count import DayCountTypes
 from financepy.utils.date import Date
 from financepy.utils.math import ONE_MILLION
+from financepy.utils.error import FinError
 from financepy.products.bonds.bond_zero import BondZero
 from financepy.products.bonds.bond import YTMCalcType, Bond
+from financepy.market.curves.discount_curve_flat import DiscountCurveFlat
+from financepy.products.credit.cds import CDS
+from financepy.products.credit.cds_curve import CDSCurve
 
 
 def test_bondtutor_example():
@@ -192,6 +197,145 @@ def test_zero_bond():
     assert abs(accrued_interest - ONE_MILLION * 0.055231 / 100) < 0.01
 
 
+def test_zero_bond_oas():
+    bond = BondZero(
+        issue_date=Date(23, 7, 2021),
+        maturity_date=Date(24, 8, 2024),
+        issue_price=90.0
+    )
+    settlement_date = Date(8, 8, 2022)
+    discount_curve = DiscountCurveFlat(settlement_date, 0.03)
+
+    oas = 0.0125
+    full_price = bond.full_price_from_oas(settlement_date, discount_curve, oas)
+    accrued_amount = bond._accrued_interest * bond._par / bond._face_amount
+    clean_price = full_price - accrued_amount
+
+    calc_oas = bond.option_adjusted_spread(settlement_date, clean_price,
+                                           discount_curve)
+    assert abs(calc_oas - oas) < 1e-10
+
+    ytm = 0.0275
+    clean_price = bond.clean_price_from_ytm(settlement_date, ytm)
+    calc_ytm = bond.yield_to_maturity(settlement_date, clean_price)
+    assert abs(calc_ytm - ytm) < 1e-10
+
+    with pytest.raises(FinError):
+        bond.option_adjusted_spread(Date(24, 8, 2024), 99.0, discount_curve)
+
+
+def test_zero_bond_risk():
+    bond = BondZero(
+        issue_date=Date(23, 7, 2021),
+        maturity_date=Date(24, 8, 2024),
+        issue_price=90.0
+    )
+    ytm = 0.0275
+    dy = 0.0001
+
+    # Check both the simple and the compounded pricing regimes
+    for settlement_date in [Date(8, 8, 2022), Date(8, 12, 2023)]:
+        p0 = bond.full_price_from_ytm(settlement_date, ytm - dy)
+        p1 = bond.full_price_from_ytm(settlement_date, ytm)
+        p2 = bond.full_price_from_ytm(settlement_date, ytm + dy)
+
+        duration = bond.dollar_duration(settlement_date, ytm)
+        assert abs(duration + (p2 - p0) / dy / 2.0) < 1e-4
+
+        modified_duration = bond.modified_duration(settlement_date, ytm)
+        assert abs(modified_duration - duration / p1) < 1e-10
+
+        conv = bond.convexity_from_ytm(settlement_date, ytm)
+        assert abs(conv - (p2 + p0 - 2.0 * p1) / dy / dy / p1 / 100.0) < 1e-4
+
+
+def test_zero_bond_asset_swap_spread():
+    bond = BondZero(
+        issue_date=Date(23, 7, 2021),
+        maturity_date=Date(24, 8, 2024),
+        issue_price=90.0
+    )
+    settlement_date = Date(8, 8, 2022)
+    discount_curve = DiscountCurveFlat(settlement_date, 0.03)
+
+    asw = bond.asset_swap_spread(settlement_date, 93.0, discount_curve)
+    assert round(asw, 10) == -0.0076071047
+
+
+def test_zero_bond_survival_curve():
+    bond = BondZero(
+        issue_date=Date(23, 7, 2021),
+        maturity_date=Date(24, 8, 2024),
+        issue_price=90.0
+    )
+    settlement_date = Date(8, 8, 2022)
+    discount_curve = DiscountCurveFlat(settlement_date, 0.03)
+    recovery_rate = 0.40
+
+    # A discount curve can be used as a survival curve
+    survival_curve = DiscountCurveFlat(settlement_date, 0.01)
+    full_price = bond.full_price_from_survival_curve(settlement_date,
+                                                     discount_curve,
+                                                     survival_curve,
+                                                     recovery_rate)
+    assert round(full_price, 8) == 92.93185945
+
+    clean_price = bond.clean_price_from_survival_curve(settlement_date,
+                                                       discount_curve,
+                                                       survival_curve,
+                                                       recovery_rate)
+    assert round(clean_price, 8) == 89.55419987
+
+    cds = CDS(settlement_date, Date(8, 8, 2027), 0.01)
+    survival_curve = CDSCurve(settlement_date, [cds], discount_curve,
+                              recovery_rate)
+    full_price = bond.full_price_from_survival_curve(settlement_date,
+                                                     discount_curve,
+                                                     survival_curve,
+                                                     recovery_rate)
+    assert round(full_price, 8) == 92.17815813
+
+    clean_price = bond.clean_price_from_survival_curve(settlement_date,
+                                                       discount_curve,
+                                                       survival_curve,
+                                                       recovery_rate)
+    assert round(clean_price, 8) == 88.80049856
+
+
+def test_zero_bond_batch_pricing():
+    settlement_date = Date(8, 8, 2022)
+    discount_curve = DiscountCurveFlat(settlement_date, 0.03)
+    maturity_dates = [Date(24, 10, 2022), Date(24, 8, 2024),
+                      Date(15, 5, 2030)]
+    ytms = [0.014, 0.0275, 0.031]
+
+    bonds = [BondZero(Date(25, 7, 2022), dt, 95.0) for dt in maturity_dates]
+
+    prices = BondZero.batch_full_price_from_ytm(maturity_dates,
+                                                settlement_date, ytms)
+    for bond, ytm, price in zip(bonds, ytms, prices):
+        assert abs(bond.full_price_from_ytm(settlement_date, ytm) - price) < 1e-8
+
+    prices = BondZero.batch_full_price_from_discount_curve(maturity_dates,
+                                                           settlement_date,
+                                                           discount_curve)
+    for bond, price in zip(bonds, prices):
+        px = bond.full_price_from_discount_curve(settlement_date,
+                                                 discount_curve)
+        assert abs(px - price) < 1e-10
+
+    with pytest.raises(FinError):
+        BondZero.batch_full_price_from_ytm([], settlement_date, ytms)
+
+    with pytest.raises(FinError):
+        BondZero.batch_full_price_from_ytm(maturity_dates, settlement_date,
+                                           ytms[:2])
+
+    with pytest.raises(FinError):
+        BondZero.batch_full_price_from_discount_curve([], settlement_date,
+                                                      discount_curve)
+
+
 def test_bond_ror():
     test_case_file = 'test_cases_bond_ror.csv'
     df = pd.read_csv('./tests/data/' + test_case_file, parse_dates=['buy_date', 'sell_date'])